@@ -0,0 +1,68 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.app import app, activities
+
+
+@pytest.fixture(scope="session")
+def pristine_activities():
+    """Canonical activities data, built once per session (once per xdist worker)
+    
+    Treat as read-only: tests get fresh copies through the reset fixtures.
+    """
+    return {
+        "Chess Club": {
+            "description": "Learn strategies and compete in chess tournaments",
+            "schedule": "Fridays, 3:30 PM - 5:00 PM",
+            "max_participants": 12,
+            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        },
+        "Programming Class": {
+            "description": "Learn programming fundamentals and build software projects",
+            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+            "max_participants": 20,
+            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        },
+        "Gym Class": {
+            "description": "Physical education and sports activities",
+            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+            "max_participants": 30,
+            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared test client, created once per test session (once per xdist worker)"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _reset_activities(pristine):
+    """Restore the activities data from the pristine snapshot"""
+    # Copy each participants list so tests never mutate the snapshot itself
+    activities.clear()
+    activities.update({
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in pristine.items()
+    })
+
+
+@pytest.fixture
+def activities_reset(pristine_activities):
+    """Reset activities data before tests that depend on or mutate it"""
+    _reset_activities(pristine_activities)
+
+    yield  # Run the test
+
+
+@pytest.fixture(scope="class")
+def activities_reset_once(pristine_activities):
+    """Reset activities data once for a class whose tests never mutate it"""
+    _reset_activities(pristine_activities)
+
+    yield  # Run the class's tests
@@ -0,0 +1,7 @@
+"""
+Shared constants for the Mergington High School Activities API tests
+"""
+
+# URL templates for the signup and unregister endpoints: (activity_name, email)
+SIGNUP_URL = "/activities/{}/signup?email={}"
+UNREGISTER_URL = "/activities/{}/unregister?email={}"
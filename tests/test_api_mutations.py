@@ -0,0 +1,64 @@
+"""
+Test cases that add, remove or empty activities in the Activities API
+
+These tests reshape the shared activities data, so they are kept apart from
+the main API tests and grouped together on a single xdist worker.
+"""
+
+from src.app import activities
+from tests.helpers import SIGNUP_URL, UNREGISTER_URL
+
+# Templates for activities injected by the tests below; copy before use
+ART_DESIGN = {
+    "description": "Creative arts class",
+    "schedule": "Mondays, 2:00 PM",
+    "max_participants": 15,
+    "participants": []
+}
+TEST_ACTIVITY = {
+    "description": "Test activity",
+    "schedule": "Test schedule",
+    "max_participants": 1,
+    "participants": ["onlyone@mergington.edu"]
+}
+
+
+class TestActivityMutations:
+    """Test cases that change the set of activities or empty their participants"""
+    
+    def test_get_activities_empty_participants(self, client, activities_reset):
+        """Test activity with no participants"""
+        # Clear participants from Chess Club
+        activities["Chess Club"]["participants"] = []
+        
+        response = client.get("/activities")
+        assert response.status_code == 200
+        assert response.json()["Chess Club"]["participants"] == []
+    
+    def test_signup_special_characters_in_activity_name(self, client, activities_reset):
+        """Test signup with URL-encoded activity name"""
+        # Add an activity with special characters for testing
+        activities["Art & Design"] = {**ART_DESIGN, "participants": list(ART_DESIGN["participants"])}
+        
+        email = "artist@mergington.edu"
+        activity_name = "Art & Design"
+        encoded_name = "Art%20%26%20Design"
+        
+        response = client.post(SIGNUP_URL.format(encoded_name, email))
+        
+        assert response.status_code == 200
+        assert response.text == f'{{"message":"Signed up {email} for {activity_name}"}}'
+    
+    def test_unregister_last_participant(self, client, activities_reset):
+        """Test unregistering the last participant from an activity"""
+        # Create activity with only one participant
+        activities["Test Activity"] = {**TEST_ACTIVITY, "participants": list(TEST_ACTIVITY["participants"])}
+        
+        email = "onlyone@mergington.edu"
+        activity_name = "Test Activity"
+        
+        response = client.delete(UNREGISTER_URL.format(activity_name, email))
+        
+        assert response.status_code == 200
+        assert response.text == f'{{"message":"Unregistered {email} from {activity_name}"}}'
+        assert activities[activity_name]["participants"] == []